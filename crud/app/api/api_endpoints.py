@@ -138,14 +138,16 @@ def view(*, db: Session = Depends(get_db), view_request: schemas.ViewRequest):
         - Assessment tracker entry does not exist
     """
     try:
-        user = crud.get_user_by_username(db=db, username=view_request.username)
-        assessment = crud.get_assessment_by_name(
+        user_id = crud.get_user_id_by_username(
+            db=db, username=view_request.username
+        )
+        assessment_id = crud.get_assessment_id_by_name(
             db=db, assessment_name=view_request.assessment_name
         )
         assessment_tracker_entry = crud.get_assessment_tracker_entry(
             db=db,
-            user_id=user.id,
-            assessment_id=assessment.id,
+            user_id=user_id,
+            assessment_id=assessment_id,
         )
     except ValueError as e:
         print(str(e))
@@ -177,16 +179,16 @@ def update(
     """
     try:
 
-        user = crud.get_user_by_username(
+        user_id = crud.get_user_id_by_username(
             db=db, username=update_request.username
         )
-        assessment = crud.get_assessment_by_name(
+        assessment_id = crud.get_assessment_id_by_name(
             db=db, assessment_name=update_request.assessment_name
         )
         assessment_tracker_entry = crud.get_assessment_tracker_entry(
             db=db,
-            user_id=user.id,
-            assessment_id=assessment.id,
+            user_id=user_id,
+            assessment_id=assessment_id,
         )
         crud.update_assessment_log(
             db=db,
@@ -337,10 +339,10 @@ def review(
             db=db, assessment_tracker_entry=assessment_tracker_entry,
             settings=settings
         )
-        reviewer_user = crud.get_user_by_id(db=db, user_id=reviewer.user_id)
+        # The reviewer's user entry is eager-loaded by select_reviewer
         reviewer_info = {
             "reviewer_id": reviewer.id,
-            "reviewer_username": reviewer_user.username,
+            "reviewer_username": reviewer.user.username,
         }
         crud.assign_reviewer(
             db=db,
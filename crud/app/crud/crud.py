@@ -1,15 +1,19 @@
 from datetime import datetime
-from sqlalchemy import true
-from sqlalchemy.orm import Session
-import random
+from cachetools import TTLCache
+from sqlalchemy import func, true
+from sqlalchemy.orm import Session, joinedload
 import requests
-import copy
 from app import utils
 import app.db.models as models
 from app.dependencies import Settings
 
-# Reproducibility for randomly selecting reviewers
-random.seed(42)
+# Name -> id caches for the small, near-static lookup tables. Scalar ids
+# are cached rather than ORM entities to avoid detached objects leaking
+# across sessions; entities are re-fetched by primary key on a hit.
+_user_id_cache = TTLCache(maxsize=256, ttl=600)
+_assessment_id_cache = TTLCache(maxsize=256, ttl=600)
+# Badge entityId -> name, for the assertion ingest fast path
+_badge_name_cache = TTLCache(maxsize=256, ttl=600)
 
 
 def get_user_by_username(db: Session, username: str):
@@ -23,14 +27,49 @@ def get_user_by_username(db: Session, username: str):
 
     :raises: ValueError if user does not exist.
     """
+    user_id = _user_id_cache.get(username)
+    if user_id is not None:
+        user = db.query(models.Users).get(user_id)
+        if user is not None and user.username == username:
+            return user
+        # Stale cache entry; fall through to the SELECT
+        _user_id_cache.pop(username, None)
+
     user = (
         db.query(models.Users).filter(models.Users.username == username).first()
     )
     if user is None:
         raise ValueError("User name does not exist")
+    _user_id_cache[username] = user.id
     return user
 
 
+def get_user_id_by_username(db: Session, username: str) -> int:
+    """
+    Return the user id based on username, without hydrating the full row.
+
+    :param db: Generator for Session of database
+    :param username: github username
+
+    :returns: User id as an int.
+
+    :raises: ValueError if user does not exist.
+    """
+    user_id = _user_id_cache.get(username)
+    if user_id is not None:
+        return user_id
+
+    user_id = (
+        db.query(models.Users.id)
+        .filter(models.Users.username == username)
+        .scalar()
+    )
+    if user_id is None:
+        raise ValueError("User name does not exist")
+    _user_id_cache[username] = user_id
+    return user_id
+
+
 def get_user_by_id(db: Session, user_id: int):
     """
     Return the user entry based on user id.
@@ -60,7 +99,7 @@ def get_reviewer_by_username(db: Session, username: str):
     :raises: ValueError if reviewer does not exist.
     """
     print("E")
-    user_id = get_user_by_username(db=db, username=username).id
+    user_id = get_user_id_by_username(db=db, username=username)
     print("F")
     reviewer = (
         db.query(models.Reviewers)
@@ -116,6 +155,14 @@ def get_assessment_by_name(db: Session, assessment_name: str):
 
     :raises: ValueError if assessment does not exist.
     """
+    assessment_id = _assessment_id_cache.get(assessment_name)
+    if assessment_id is not None:
+        assessment = db.query(models.Assessments).get(assessment_id)
+        if assessment is not None and assessment.name == assessment_name:
+            return assessment
+        # Stale cache entry; fall through to the SELECT
+        _assessment_id_cache.pop(assessment_name, None)
+
     assessment = (
         db.query(models.Assessments)
         .filter(models.Assessments.name == assessment_name)
@@ -123,10 +170,38 @@ def get_assessment_by_name(db: Session, assessment_name: str):
     )
     if assessment is None:
         raise ValueError("Assessment does not exist")
+    _assessment_id_cache[assessment_name] = assessment.id
 
     return assessment
 
 
+def get_assessment_id_by_name(db: Session, assessment_name: str) -> int:
+    """
+    Return the assessment id based on assessment name, without hydrating
+    the full row.
+
+    :param db: Generator for Session of database
+    :param assessment_name: assessment name
+
+    :returns: Assessment id as an int.
+
+    :raises: ValueError if assessment does not exist.
+    """
+    assessment_id = _assessment_id_cache.get(assessment_name)
+    if assessment_id is not None:
+        return assessment_id
+
+    assessment_id = (
+        db.query(models.Assessments.id)
+        .filter(models.Assessments.name == assessment_name)
+        .scalar()
+    )
+    if assessment_id is None:
+        raise ValueError("Assessment does not exist")
+    _assessment_id_cache[assessment_name] = assessment_id
+    return assessment_id
+
+
 def get_assessment_by_id(db: Session, assessment_id: int):
     """
     Return the assessment entry based on assessment id.
@@ -236,41 +311,45 @@ def create_assessment_tracker_entry(
         - User does not exist
     """
     # Check if assessment tracker entry exists and if not, create one
-    try:
-        get_assessment_tracker_entry(
-            db=db, assessment_id=assessment_id, user_id=user_id
+    # EXISTS pushes the check into the DB without hydrating the row
+    entry_exists = db.query(
+        db.query(models.AssessmentTracker)
+        .filter(
+            models.AssessmentTracker.user_id == user_id,
+            models.AssessmentTracker.assessment_id == assessment_id,
         )
+        .exists()
+    ).scalar()
+    if entry_exists:
         raise ValueError("Assessment tracker entry already exists.")
-    except ValueError as e:
-        # Raise the error if it's not about a missing entry
-        if str(e) != "Assessment tracker entry unavailable.":
-            raise e
-
-        # Ensure user exists
-        user = get_user_by_id(db=db, user_id=user_id)
-
-        # Ensure assessment exists
-        assessment = get_assessment_by_id(db=db, assessment_id=assessment_id)
-
-        # Create a new entry if it doesn't exist yet
-        db_obj = models.AssessmentTracker(
-            user_id=user.id,
-            assessment_id=assessment.id,
-            last_updated=datetime.utcnow(),
-            status="Pre-assessment",
-            latest_commit=commit,
-            log=[
-                {
-                    "status": "Pre-assessment",
-                    "timestamp": str(datetime.utcnow()),
-                    "commit": None,
-                }
-            ],
-        )
-        db.add(db_obj)
-        db.commit()
 
-        return True
+    # Ensure user exists
+    user = get_user_by_id(db=db, user_id=user_id)
+
+    # Ensure assessment exists
+    assessment = get_assessment_by_id(db=db, assessment_id=assessment_id)
+
+    # Create a new entry if it doesn't exist yet
+    # Take the timestamp once so last_updated and the log entry agree
+    now = datetime.utcnow()
+    db_obj = models.AssessmentTracker(
+        user_id=user.id,
+        assessment_id=assessment.id,
+        last_updated=now,
+        status="Pre-assessment",
+        latest_commit=commit,
+        log=[
+            {
+                "status": "Pre-assessment",
+                "timestamp": str(now),
+                "commit": None,
+            }
+        ],
+    )
+    db.add(db_obj)
+    db.commit()
+
+    return True
 
 
 def update_assessment_tracker_entry(
@@ -301,17 +380,19 @@ def update_assessment_tracker_entry(
 
     try:
         # Update the entry
+        # Take the timestamp once so last_updated and the log entry agree
+        now = datetime.utcnow()
         assessment_tracker.status = status
         assessment_tracker.latest_commit = commit
         assessment_tracker.repo_owner = github_url.split("/")[3]
         assessment_tracker.repo_name = github_url.split("/")[4]
         assessment_tracker.pr_number = 1
-        assessment_tracker.last_updated = datetime.utcnow()
+        assessment_tracker.last_updated = now
         # Add the new log entry
         assessment_tracker.log.append(
             {
                 "status": status,
-                "timestamp": str(datetime.utcnow()),
+                "timestamp": str(now),
                 "commit": commit,
             }
         )
@@ -342,46 +423,27 @@ def select_reviewer(
     if settings.APP_ENV_NAME == "testing":
         return get_reviewer_by_username(db=db, username="brnbot2")
 
-    invalid_rev = (
-        db.query(models.Reviewers)
-        .filter(models.Reviewers.user_id == assessment_tracker_entry.user_id)
-        .with_entities(models.Reviewers.id)
-        .all()
-    )
-    invalid_rev = [i[0] for i in invalid_rev]
-
-    # Get all reviewers
-    valid_reviewers = (
+    # Pick a random valid reviewer in the database so that only the
+    # chosen row leaves the DB; the reviewer's user entry is joined in
+    # the same statement for callers that need the username
+    # Will be replaced with Slack integration
+    random_reviewer = (
         db.query(models.Reviewers)
+        .options(joinedload(models.Reviewers.user))
         .filter(
-            models.Reviewers.id.notin_(invalid_rev),
+            models.Reviewers.user_id != assessment_tracker_entry.user_id,
             # Uncomment to filter by assessments the reviewer can do
             # assessment.id in models.Reviewers.assessment_reviewing_info,
         )
-        .with_entities(models.Reviewers.id)
-        .all()
+        .order_by(func.rand())
+        .first()
     )
-
-    try:
-        # Get a random reviewer from the list of valid reviewers
-        # Will be replaced with Slack integration
-        random_id = valid_reviewers[
-            random.randint(0, len(valid_reviewers) - 1)
-        ][0]
-    except Exception:  # pragma: no cover
+    if random_reviewer is None:  # pragma: no cover
         raise ValueError(
             "No reviewer available. Please contact the administrator."
         )
 
-    try:
-        random_reviewer = get_reviewer_by_id(db=db, reviewer_id=random_id)
-        return random_reviewer
-    except Exception as e:  # pragma: no cover
-        raise Exception(
-            "Error selecting reviewer. Contact the administrators. Error"
-            " string: "
-            + str(e)
-        )
+    return random_reviewer
 
 
 def assign_reviewer(
@@ -402,18 +464,20 @@ def assign_reviewer(
     :raises: None (hopefully)
     """
     # Update the assessment tracker entry
+    # No commit here: update_assessment_log commits below, writing the
+    # reviewer assignment and its log entry in one transaction
     assessment_tracker_entry.reviewer_id = reviewer_info["reviewer_id"]
     assessment_tracker_entry.status = "Under review"
     assessment_tracker_entry.last_updated = datetime.utcnow()
-    db.add(assessment_tracker_entry)
-    db.commit()
 
     # Update the assessment tracker entry log
+    # Shallow copy is enough here: update_assessment_log only adds
+    # top-level keys and reviewer_info holds flat scalars
     update_assessment_log(
         db=db,
         entry_id=assessment_tracker_entry.id,
         latest_commit=assessment_tracker_entry.latest_commit,
-        update_logs=copy.deepcopy(reviewer_info),
+        update_logs=dict(reviewer_info),
     )  # Update logs
 
     return True
@@ -472,15 +536,21 @@ def approve_assessment(
         if assessment_tracker_entry.status != "Under review":
             raise ValueError("Assessment is not under review.")
 
-        # Get the reviewer, based on the assessment_tracker entry
-        reviewer_real = get_reviewer_by_id(
-            db=db, reviewer_id=assessment_tracker_entry.reviewer_id
-        )
-        reviewer_real_user = get_user_by_id(
-            db=db, user_id=reviewer_real.user_id
+        # Get the assigned reviewer's username in a single query by
+        # joining the Reviewers and Users tables
+        reviewer_real_username = (
+            db.query(models.Users.username)
+            .join(
+                models.Reviewers,
+                models.Reviewers.user_id == models.Users.id,
+            )
+            .filter(
+                models.Reviewers.id == assessment_tracker_entry.reviewer_id
+            )
+            .scalar()
         )
         # Verify the approval request is from the reviewer
-        if reviewer_real_user.username != reviewer_username:
+        if reviewer_real_username != reviewer_username:
             raise ValueError(
                 "Reviewer is not the same as the reviewer assigned to the"
                 " assessment."
@@ -493,18 +563,17 @@ def approve_assessment(
     latest_commit = assessment_tracker_entry.latest_commit
 
     # Approve the assessment and update the log / status
+    # Take the timestamp once so last_updated and the log entry agree
+    now = datetime.utcnow()
     assessment_tracker_entry.status = "Approved"
-    assessment_tracker_entry.last_updated = datetime.utcnow()
+    assessment_tracker_entry.last_updated = now
     log = {
-        "timestamp": str(datetime.utcnow()),
+        "timestamp": str(now),
         "status": "Approved",
         "commit": latest_commit,
         "Reviewer": reviewer,
     }
-    logs = list(assessment_tracker_entry.log)
-    logs.append(log)
-    assessment_tracker_entry.log = logs
-    db.add(assessment_tracker_entry)
+    assessment_tracker_entry.log.append(log)
     db.commit()
 
     return True
@@ -522,20 +591,18 @@ def add_assertion(
     :param entry_id: Assessment tracker entry id
     :param assertion: Assertion to add
     """
-    print(assertion["badgeclass"])
-    badge = (
-        db.query(models.Badges)
-        .filter(models.Badges.entityId == assertion["badgeclass"])
-        .first()
-    )
-    # Get the badge name for the assertion
-    if badge is None:
-        raise ValueError("Badge does not exist in database")
-    try:
-        badge_name = badge.name
-    except Exception as e:  # pragma: no cover
-        print(str(e))
-        raise e
+    # Get the badge name for the assertion; the badges table is nearly
+    # static, so cached entityId -> name hits skip the SELECT entirely
+    badge_name = _badge_name_cache.get(assertion["badgeclass"])
+    if badge_name is None:
+        badge_name = (
+            db.query(models.Badges.name)
+            .filter(models.Badges.entityId == assertion["badgeclass"])
+            .scalar()
+        )
+        if badge_name is None:
+            raise ValueError("Badge does not exist in database")
+        _badge_name_cache[assertion["badgeclass"]] = badge_name
 
     # Wrangle the assertion
     fields = utils.wrangle_assertion(
@@ -548,7 +615,6 @@ def add_assertion(
 
     # Add the assertion to the Assertions table if it doesn't exist, else update it
     try:
-        print("Assertion does not exist. Adding...")
         assertobj = models.Assertions(**fields)
         db.add(assertobj)
         db.commit()
@@ -589,14 +655,11 @@ def update_assessment_log(
     assessment_tracker_entry.latest_commit = latest_commit
     if status:
         assessment_tracker_entry.status = status
-    logs = list(assessment_tracker_entry.log)
     update_logs["commit"] = latest_commit
     update_logs["timestamp"] = str(assessment_tracker_entry.last_updated)
-    logs.append(update_logs)
-    assessment_tracker_entry.log = logs
+    assessment_tracker_entry.log.append(update_logs)
 
     # Commit the changes
-    db.add(assessment_tracker_entry)
     db.commit()
 
     return True
@@ -677,6 +740,7 @@ def delete_user(db: Session, user_id: int, settings: dict) -> None:
         # Delete user
         db.delete(user)
         db.commit()
+        _user_id_cache.pop(user.username, None)
     except ValueError as e:
         print(str(e))
         db.rollback()
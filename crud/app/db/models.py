@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Index,
     Table,
     Text,
 )
@@ -13,7 +14,7 @@ from typing import Any
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 from datetime import datetime
 from sqlalchemy.orm import relationship
-from sqlalchemy.ext.mutable import MutableDict
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 
 
 @as_declarative()
@@ -104,6 +105,8 @@ class Reviewers(Base):
         ),
     )
 
+    user = relationship(Users, foreign_keys=[user_id])
+
 
 # Create a mapping between the Assessment and Reviewer tables
 assessments_to_reviewers = Table(
@@ -145,6 +148,16 @@ class AssessmentTracker(Base):
 
     __tablename__ = "assessment_tracker"
 
+    # Composite index for the (user_id, assessment_id) lookup used on
+    # every init/view/update/approve request
+    __table_args__ = (
+        Index(
+            "ix_assessment_tracker_user_id_assessment_id",
+            "user_id",
+            "assessment_id",
+        ),
+    )
+
     id = Column(Integer, primary_key=True, unique=True, index=True)
     user_id = Column(
         Integer,
@@ -160,7 +173,7 @@ class AssessmentTracker(Base):
             name="fk_assessment_tracker_assessments",
         ),
     )
-    status = Column(String(250))
+    status = Column(String(250), index=True)
     last_updated = Column(DateTime)
     latest_commit = Column(String(250), nullable=False, unique=True)
     reviewer_id = Column(
@@ -170,11 +183,18 @@ class AssessmentTracker(Base):
             use_alter=True,
             name="fk_assessment_tracker_reviewers",
         ),
+        index=True,
     )
     repo_owner = Column(String(250))
     repo_name = Column(String(250))
     pr_number = Column(Integer)
-    log = Column(JSON, nullable=False)
+    # MutableList tracks in-place appends so log entries can be added
+    # without copying the whole list on every update
+    log = Column(MutableList.as_mutable(JSON), nullable=False)
+
+    user = relationship(Users, foreign_keys=[user_id])
+    assessment = relationship(Assessments, foreign_keys=[assessment_id])
+    reviewer = relationship(Reviewers, foreign_keys=[reviewer_id])
 
 
 class Badges(Base):
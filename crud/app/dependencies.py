@@ -70,7 +70,21 @@ SQLALCHEMY_DATABASE_URI = (
 )
 
 # Create DB engine and get local session
-engine = create_engine(SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+# query_cache_size raises the compiled-statement cache above its
+# 500-entry default so hot statements aren't evicted and recompiled
+# under LRU pressure
+# pool_recycle refreshes connections before MySQL's wait_timeout can
+# drop them server-side; pre-ping catches the ones that die anyway
+# pool_size/max_overflow lift the 5+10 default so concurrent requests
+# don't queue on connection checkout
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_size=20,
+    max_overflow=40,
+    pool_recycle=3600,
+    query_cache_size=1200,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # to get local DB
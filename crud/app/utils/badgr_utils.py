@@ -1,10 +1,18 @@
 # Script for issue badge to a user
+import re
 import requests
 import json
 from datetime import datetime
 from app import Settings
 from app.db import Assertions
 
+# Matches Badgr's ISO8601 timestamps, e.g. "2022-05-18T01:02:03Z" or
+# "2022-05-18T01:02:03.456Z", with an optional fractional-seconds group
+# capped at the 6 digits strptime's %f can parse
+_ISO8601_RE = re.compile(
+    r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d{1,6})?Z$"
+)
+
 
 def get_bearer_token(config: Settings):
     """
@@ -114,20 +122,18 @@ def wrangle_assertion(
         fields["evidence_url"] = assertion["evidence"][0]["url"]
         fields["evidence_narrative"] = assertion["evidence"][0]["narrative"]
 
-    # Convert to date time
+    # Convert ISO8601 timestamp fields to date time; the regex pre-screen
+    # avoids strptime exception probing on every non-timestamp field
     for k, v in fields.items():
-        try:
-            if type(v) == str:
-                fields[k] = datetime.strptime(v, "%Y-%m-%dT%H:%M:%S.%fZ")
-            else:
-                print("Could not convert to date time: " + str(v))
-        except ValueError:
-            # Try different format
-            try:
-                fields[k] = datetime.strptime(v, "%Y-%m-%dT%H:%M:%SZ")
-            except ValueError:
-                print("Could not convert to date time: " + str(v))
-                pass
+        if not isinstance(v, str):
+            continue
+        match = _ISO8601_RE.match(v)
+        if match is None:
+            continue
+        if match.group(1):
+            fields[k] = datetime.strptime(v, "%Y-%m-%dT%H:%M:%S.%fZ")
+        else:
+            fields[k] = datetime.strptime(v, "%Y-%m-%dT%H:%M:%SZ")
 
     # Convert createdAt to a datetime object from ISO8601
     ca = fields["createdAt"]
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 import pytest
 import copy
 from app import crud, utils
+from app.crud.crud import _assessment_id_cache, _user_id_cache
 import app.db.models as models
 from app.dependencies import settings
 from sqlalchemy.exc import IntegrityError
@@ -29,6 +30,57 @@ def test_get_user_by_username(db: Session):
     assert "User name does not exist" in str(exc.value)
 
 
+def test_get_user_by_username_cache(db: Session):
+
+    # Get a valid user
+    user = db.query(models.Users).first()
+
+    # Miss: an empty cache is populated by the lookup
+    _user_id_cache.clear()
+    crud.get_user_by_username(db=db, username=user.username)
+    assert _user_id_cache[user.username] == user.id
+
+    # Hit: the cached id resolves to the same entry
+    cached = crud.get_user_by_username(db=db, username=user.username)
+    assert cached.id == user.id
+
+    # Stale: a cached id with no matching row falls back to the SELECT
+    # and repopulates the cache
+    _user_id_cache[user.username] = 0
+    stale = crud.get_user_by_username(db=db, username=user.username)
+    assert stale.id == user.id
+    assert _user_id_cache[user.username] == user.id
+
+    # Stale: a cached id pointing at a different user also falls back
+    other_user = db.query(models.Users).filter(
+        models.Users.id != user.id
+    ).first()
+    _user_id_cache[user.username] = other_user.id
+    stale = crud.get_user_by_username(db=db, username=user.username)
+    assert stale.id == user.id
+    assert _user_id_cache[user.username] == user.id
+
+
+def test_get_user_id_by_username(db: Session):
+
+    # Get a valid user
+    user = db.query(models.Users).first()
+
+    # Success - uncached
+    _user_id_cache.clear()
+    user_id = crud.get_user_id_by_username(db=db, username=user.username)
+    assert user_id == user.id
+
+    # Success - served from the cache
+    user_id = crud.get_user_id_by_username(db=db, username=user.username)
+    assert user_id == user.id
+
+    # Unsuccessful
+    with pytest.raises(ValueError) as exc:
+        crud.get_user_id_by_username(db=db, username="")
+    assert "User name does not exist" in str(exc.value)
+
+
 def test_get_user_by_id(db: Session):
 
     # Get a valid user
@@ -119,6 +171,56 @@ def test_get_assessment_by_name(db: Session):
     assert "Assessment does not exist" in str(exc.value)
 
 
+def test_get_assessment_by_name_cache(db: Session):
+
+    # Get assessment where name is Test
+    assessment = db.query(models.Assessments).filter(models.Assessments.name == "Test").first()
+
+    # Miss: an empty cache is populated by the lookup
+    _assessment_id_cache.clear()
+    crud.get_assessment_by_name(db=db, assessment_name=assessment.name)
+    assert _assessment_id_cache[assessment.name] == assessment.id
+
+    # Hit: the cached id resolves to the same entry
+    cached = crud.get_assessment_by_name(
+        db=db, assessment_name=assessment.name
+    )
+    assert cached.id == assessment.id
+
+    # Stale: a cached id with no matching row falls back to the SELECT
+    # and repopulates the cache
+    _assessment_id_cache[assessment.name] = 0
+    stale = crud.get_assessment_by_name(
+        db=db, assessment_name=assessment.name
+    )
+    assert stale.id == assessment.id
+    assert _assessment_id_cache[assessment.name] == assessment.id
+
+
+def test_get_assessment_id_by_name(db: Session):
+
+    # Get assessment where name is Test
+    assessment = db.query(models.Assessments).filter(models.Assessments.name == "Test").first()
+
+    # Success - uncached
+    _assessment_id_cache.clear()
+    assessment_id = crud.get_assessment_id_by_name(
+        db=db, assessment_name=assessment.name
+    )
+    assert assessment_id == assessment.id
+
+    # Success - served from the cache
+    assessment_id = crud.get_assessment_id_by_name(
+        db=db, assessment_name=assessment.name
+    )
+    assert assessment_id == assessment.id
+
+    # Unsuccessful
+    with pytest.raises(ValueError) as exc:
+        crud.get_assessment_id_by_name(db=db, assessment_name="")
+    assert "Assessment does not exist" in str(exc.value)
+
+
 def test_get_assessment_by_id(db: Session):
 
     # Get assessment where name is Test
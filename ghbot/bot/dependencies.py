@@ -94,7 +94,6 @@ class Settings(BaseSettings):
 
 @lru_cache()
 def get_settings():
-    print(os.environ.get("APP_ENV"))
     if os.environ.get("APP_ENV") == "development":
         print("Loading development settings")
         settings = Settings(_env_file=".dev.env", _env_file_encoding="utf-8")
@@ -16,7 +16,17 @@ SQLALCHEMY_DATABASE_URI = (
     + settings.RDS_DB_NAME
 )
 
-engine = create_engine(SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+# query_cache_size raises the compiled-statement cache above its
+# 500-entry default so hot statements aren't evicted and recompiled
+# under LRU pressure
+# pool_recycle refreshes connections before MySQL's wait_timeout can
+# drop them server-side; pre-ping catches the ones that die anyway
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    query_cache_size=1200,
+)
 
 # Create the database tables
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
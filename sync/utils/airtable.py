@@ -47,7 +47,6 @@ def sync_assessments(settings: Settings, db_session: Session):
                 )
                 assessment = Assessments(**fields)
                 db_session.add(assessment)
-                db_session.commit()
             else:
                 print(
                     "Assessment already exists -- updating: "
@@ -57,7 +56,9 @@ def sync_assessments(settings: Settings, db_session: Session):
                 )
                 # Update the assessment in the database
                 current_assessment.update(values=fields)
-                db_session.commit()
+
+        # Commit all inserts and updates in a single transaction
+        db_session.commit()
     except Exception as e:
         print(str(e))
         # Rollback the changes to the database
@@ -1,10 +1,14 @@
 # Script for issue badge to a user
+import logging
 import requests
 from datetime import datetime
 from config import Settings
 from models import Badges, Assertions
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+logger = logging.getLogger(__name__)
+
 
 def badgr_bearer_token(config: Settings):
     """
@@ -234,27 +238,42 @@ def sync_badges(settings: Settings, db_session: Session):
 
     # Loop through all badges and add them to the badges table
     try:
+        # Fetch all previously synced badges in one query, keyed by name,
+        # instead of issuing one existence check per badge
+        existing_badges = {
+            b.name: b
+            for b in db_session.query(Badges)
+            .filter(Badges.name.in_([b["name"] for b in badgelst]))
+            .all()
+        }
+
+        new_badges = []
         for badge in badgelst:
-            print(badge["name"])
-
-            # Check if the badge already exists in the database
-            current_badge = db_session.query(Badges).filter_by(
-                name=badge["name"]
-            )
-
             # Convert all the fields to strings using dict comprehension
             fields = {k: str(v) for k, v in badge.items()}
 
-            if current_badge.first() is None:
-                print("Badge does not exist in database")
-                badge = Badges(**fields)
-                db_session.add(badge)
-                db_session.commit()
+            current_badge = existing_badges.get(badge["name"])
+            if current_badge is None:
+                new_badges.append(fields)
             else:
-                print("Badge already exists -- updating")
                 # Update the badge in the database
-                current_badge.update(values=fields)
-                db_session.commit()
+                for k, v in fields.items():
+                    setattr(current_badge, k, v)
+
+        # One batched log line instead of a print per badge
+        logger.debug(
+            "Syncing %d badges (%d new): %s",
+            len(badgelst),
+            len(new_badges),
+            ", ".join(badge["name"] for badge in badgelst),
+        )
+
+        # Insert all new badges with one multi-row INSERT statement
+        if new_badges:
+            db_session.execute(insert(Badges).values(new_badges))
+
+        # Commit all inserts and updates in a single transaction
+        db_session.commit()
     except Exception as e:
         print(str(e))
         # Rollback the changes to the database
@@ -293,7 +312,6 @@ def sync_assertions(settings: Settings, db_session: Session):
                     + assertion.badgeclass
                 )
                 db_session.add(assertion)
-                db_session.commit()
             else:
                 print(
                     "Already in database (updating) - "
@@ -303,7 +321,9 @@ def sync_assertions(settings: Settings, db_session: Session):
                 )
                 # Update the assertion in the database
                 current_assertion.update(values=fields)
-                db_session.commit()
+
+        # Commit all inserts and updates in a single transaction
+        db_session.commit()
     except Exception as e:
         print(str(e))
         # Rollback the changes to the database
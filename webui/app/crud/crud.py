@@ -38,11 +38,13 @@ def get_assessments(
             if assessment.types in types
         ]
     if not completed == "true":
-        # Get the user's assessments from the assertions
-        ats = get_assessment_tracker_entries_by_user(db, user)
-        # Get the assessment tracker ids from the user's assessments
+        # Get the ids of the user's approved assessments as a scalar
+        # column fetch, skipping hydration of full tracker entries
         user_assessment_ids = [
-            at.assessment_id for at in ats if at.status == "Approved"
+            row.assessment_id
+            for row in db.query(models.AssessmentTracker.assessment_id)
+            .filter_by(user_id=user.id, status="Approved")
+            .all()
         ]
         # Get the assessments that the user has completed
         assessments = [
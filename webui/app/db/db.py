@@ -18,7 +18,17 @@ SQLALCHEMY_DATABASE_URI = (
     + settings.RDS_DB_NAME
 )
 
-engine = create_engine(SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+# query_cache_size raises the compiled-statement cache above its
+# 500-entry default so hot statements aren't evicted and recompiled
+# under LRU pressure
+# pool_recycle refreshes connections before MySQL's wait_timeout can
+# drop them server-side; pre-ping catches the ones that die anyway
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    query_cache_size=1200,
+)
 if not database_exists(engine.url):  # Checks for the first time
     create_database(engine.url)  # Create new DB
     print("New Database Created")  # Verifies if database is there or not.
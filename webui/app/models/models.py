@@ -7,6 +7,7 @@ from sqlalchemy import (
     Boolean,
     Column,
     ForeignKey,
+    Index,
     Table,
     Text,
 )
@@ -142,6 +143,16 @@ class AssessmentTracker(Base):
 
     __tablename__ = "assessment_tracker"
 
+    # Composite index for the (user_id, assessment_id) lookup used on
+    # every init/view/update/approve request
+    __table_args__ = (
+        Index(
+            "ix_assessment_tracker_user_id_assessment_id",
+            "user_id",
+            "assessment_id",
+        ),
+    )
+
     id = Column(Integer, primary_key=True, unique=True, index=True)
     user_id = Column(
         Integer,
@@ -157,7 +168,7 @@ class AssessmentTracker(Base):
             name="fk_assessment_tracker_assessments",
         ),
     )
-    status = Column(String(250))
+    status = Column(String(250), index=True)
     last_updated = Column(DateTime)
     latest_commit = Column(String(250), nullable=False, unique=True)
     reviewer_id = Column(
@@ -167,6 +178,7 @@ class AssessmentTracker(Base):
             use_alter=True,
             name="fk_assessment_tracker_reviewers",
         ),
+        index=True,
     )
     repo_owner = Column(String(250))
     repo_name = Column(String(250))
@@ -1,11 +1,15 @@
+import logging
 import time
 from app.config import Settings
 from app import utils
 from app.models.models import Badges, Assertions, Assessments
 from app.db import db_session
+from sqlalchemy import insert
 
 import boto3
 
+logger = logging.getLogger(__name__)
+
 
 def print_date_time():
     print(time.strftime("%A, %d. %B %Y %I:%M:%S %p"))
@@ -24,27 +28,42 @@ def sync_badges(settings: Settings):
 
     # Loop through all badges and add them to the badges table
     try:
+        # Fetch all previously synced badges in one query, keyed by name,
+        # instead of issuing one existence check per badge
+        existing_badges = {
+            b.name: b
+            for b in db_session.query(Badges)
+            .filter(Badges.name.in_([b["name"] for b in badgelst]))
+            .all()
+        }
+
+        new_badges = []
         for badge in badgelst:
-            print(badge["name"])
-
-            # Check if the badge already exists in the database
-            current_badge = db_session.query(Badges).filter_by(
-                name=badge["name"]
-            )
-
             # Convert all the fields to strings using dict comprehension
             fields = {k: str(v) for k, v in badge.items()}
 
-            if current_badge.first() is None:
-                print("Badge does not exist in database")
-                badge = Badges(**fields)
-                db_session.add(badge)
-                db_session.commit()
+            current_badge = existing_badges.get(badge["name"])
+            if current_badge is None:
+                new_badges.append(fields)
             else:
-                print("Badge already exists -- updating")
                 # Update the badge in the database
-                current_badge.update(values=fields)
-                db_session.commit()
+                for k, v in fields.items():
+                    setattr(current_badge, k, v)
+
+        # One batched log line instead of a print per badge
+        logger.debug(
+            "Syncing %d badges (%d new): %s",
+            len(badgelst),
+            len(new_badges),
+            ", ".join(badge["name"] for badge in badgelst),
+        )
+
+        # Insert all new badges with one multi-row INSERT statement
+        if new_badges:
+            db_session.execute(insert(Badges).values(new_badges))
+
+        # Commit all inserts and updates in a single transaction
+        db_session.commit()
     except Exception as e:
         print(str(e))
         # Rollback the changes to the database
@@ -78,12 +97,13 @@ def sync_assertions(settings: Settings):
                 print("Assertion does not exist in database")
                 assertion = Assertions(**fields)
                 db_session.add(assertion)
-                db_session.commit()
             else:
                 print("Assertion already exists -- updating")
                 # Update the assertion in the database
                 current_assertion.update(values=fields)
-                db_session.commit()
+
+        # Commit all inserts and updates in a single transaction
+        db_session.commit()
     except Exception as e:
         print(str(e))
         # Rollback the changes to the database
@@ -125,7 +145,6 @@ def sync_assessments():
                 )
                 assessment = Assessments(**fields)
                 db_session.add(assessment)
-                db_session.commit()
             else:
                 print(
                     "Assessment already exists -- updating: "
@@ -135,7 +154,9 @@ def sync_assessments():
                 )
                 # Update the assessment in the database
                 current_assessment.update(values=fields)
-                db_session.commit()
+
+        # Commit all inserts and updates in a single transaction
+        db_session.commit()
     except Exception as e:
         print(str(e))
         # Rollback the changes to the database